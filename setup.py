@@ -15,9 +15,12 @@ setup(
     install_requires=[
         "fastapi",
         "uvicorn",
-        "httpx",
+        "httpx[http2]",
         "pydantic",
         "python-dotenv",
+        "orjson",
+        "msgspec",
+        "uvloop; sys_platform != 'win32'",
     ],
     entry_points={
         'console_scripts': [
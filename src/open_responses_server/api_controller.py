@@ -1,18 +1,43 @@
-import json
+import re
+import asyncio
+import logging
+from typing import AsyncIterator
+import orjson
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import StreamingResponse, Response, JSONResponse
+from fastapi.responses import StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from open_responses_server.common.config import logger
-from open_responses_server.common.config import ENABLE_MCP_TOOLS
-from open_responses_server.common.llm_client import startup_llm_client, shutdown_llm_client, LLMClient
+from open_responses_server.common.config import logger, start_log_listener, stop_log_listener
+from open_responses_server.common.llm_client import startup_llm_client, shutdown_llm_client, LLMClient, aiter_raw_and_close
 from open_responses_server.common.mcp_manager import mcp_manager
 from open_responses_server.responses_service import convert_responses_to_chat_completions, process_chat_completions_stream, convert_chat_completions_to_responses
+from open_responses_server.common.sse import STREAM_HEADERS
 from open_responses_server.chat_completions_service import handle_chat_completions
 
+# Constant response bodies, serialized once at import time
+ROOT_RESPONSE_BYTES = orjson.dumps({"message": "Open Responses Server is running."})
+HEALTH_OK_BYTES = orjson.dumps({"status": "ok", "adapter": "running", "llm_backend": True})
+HEALTH_DEGRADED_BYTES = orjson.dumps({"status": "degraded", "adapter": "running", "llm_backend": False})
+
+# SSE error frame envelope around an orjson-encoded message string
+ERROR_FRAME_PREFIX = b'data: {"type":"error","error":{"message":'
+ERROR_FRAME_SUFFIX = b'}}\n\n'
+
+def _error_frame(message: str) -> bytes:
+    """Returns an SSE error event frame for the given message."""
+    return ERROR_FRAME_PREFIX + orjson.dumps(message) + ERROR_FRAME_SUFFIX
+
+class ORJSONResponse(Response):
+    """JSON response serialized with orjson."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 app = FastAPI(
     title="Open Responses Server",
     description="A proxy server that converts between different OpenAI-compatible API formats.",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -27,8 +52,11 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Application startup event handler."""
-    await startup_llm_client()
-    await mcp_manager.startup_mcp_servers()
+    start_log_listener()
+    # The LLM client and MCP servers are independent, so start them concurrently
+    async with asyncio.TaskGroup() as startup_tasks:
+        startup_tasks.create_task(startup_llm_client())
+        startup_tasks.create_task(mcp_manager.startup_mcp_servers())
     logger.info("API Controller startup complete.")
 
 @app.on_event("shutdown")
@@ -37,6 +65,7 @@ async def shutdown_event():
     await shutdown_llm_client()
     await mcp_manager.shutdown_mcp_servers()
     logger.info("API Controller shutdown complete.")
+    stop_log_listener()
 
 
 # API endpoints
@@ -46,89 +75,13 @@ async def create_response(request: Request):
     Create a response in Responses API format, translating to/from chat.completions API.
     """
     try:
-        logger.info("Received request to /responses")
-        request_data = await request.json()
-        
-        # Log basic request information
-        logger.info(f"Received request: model={request_data.get('model')}, stream={request_data.get('stream')}")
-        
-        # Log basic input summary
-        if "input" in request_data and request_data["input"]:
-            input_count = len(request_data["input"])
-            logger.info(f"Processing {input_count} input item(s)")
-        
-        # Inject cached MCP tools into request_data before conversion so conversion sees them
-        if mcp_manager.mcp_functions_cache and ENABLE_MCP_TOOLS:
-            # Get existing tools from request_data or initialize empty list
-            existing_tools = request_data.get("tools", [])
-            
-            # Create tools format for MCP functions
-            mcp_tools = [
-                {"type": "function", "name": f["name"], "description": f.get("description"), "parameters": f.get("parameters", {})}
-                for f in mcp_manager.mcp_functions_cache
-            ]
-            
-            # Get the names of existing tools to avoid duplicates
-            existing_tool_names = set(tool["name"] for tool in existing_tools if "name" in tool)
-            
-            # Only add MCP tools that don't conflict with existing tools
-            filtered_mcp_tools = [
-                tool for tool in mcp_tools 
-                if tool["name"] not in existing_tool_names
-            ]
-            
-            # Append filtered MCP tools to existing tools, keeping existing tools first (priority)
-            request_data["tools"] = existing_tools + filtered_mcp_tools
-            
-            logger.info(f"Injected {len(filtered_mcp_tools)} MCP tools into request (total: {len(request_data['tools'])} tools)")
-        else:
-            logger.info("No MCP tools available or disabled")
+        request_data = orjson.loads(await request.body())
         
         # Convert request to chat.completions format
         chat_request = convert_responses_to_chat_completions(request_data)
         
         # Inject cached MCP tool definitions
-        if mcp_manager.mcp_functions_cache and ENABLE_MCP_TOOLS:
-            # Keep any existing functions and merge with MCP functions
-            existing_functions = chat_request.get("functions", [])
-            
-            # Convert to the "tools" format which is more broadly supported
-            if "tools" not in chat_request:
-                chat_request["tools"] = []
-                
-            # Get existing tool names to avoid duplicates and ensure priority
-            existing_tool_names = set()
-            for tool in chat_request["tools"]:
-                if isinstance(tool, dict) and "function" in tool and "name" in tool["function"]:
-                    existing_tool_names.add(tool["function"]["name"])
-                elif isinstance(tool, dict) and "name" in tool:
-                    existing_tool_names.add(tool["name"])
-            
-            # First convert existing functions to tools format
-            for func in existing_functions:
-                if func.get("name") not in existing_tool_names:
-                    chat_request["tools"].append({
-                        "type": "function",
-                        "function": func
-                    })
-                    existing_tool_names.add(func.get("name", ""))
-            
-            # Then add MCP functions that don't conflict with existing tools
-            mcp_tools_added = []
-            for func in mcp_manager.mcp_functions_cache:
-                if func.get("name") not in existing_tool_names:
-                    chat_request["tools"].append({
-                        "type": "function",
-                        "function": func
-                    })
-                    mcp_tools_added.append(func.get("name"))
-            
-            # Remove the functions key as we've converted to tools format
-            chat_request.pop("functions", None)
-            
-            logger.info(f"Converted {len(existing_functions)} functions, added {len(mcp_tools_added)} MCP tools to chat request")
-        else:
-            logger.info("No MCP functions cached or MCP tools disabled")
+        mcp_tools_added = mcp_manager.inject_chat_tools(chat_request)
         
         # Remove tool_choice when no functions/tools are provided
         if not chat_request.get("functions") and not chat_request.get("tools"):
@@ -140,54 +93,68 @@ async def create_response(request: Request):
         # Check for streaming mode
         stream = request_data.get("stream", False)
         
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "/responses request: model=%s stream=%s input_items=%d messages=%d tools=%d mcp_tools_added=%d",
+                request_data.get("model"), stream, len(request_data.get("input") or ()),
+                len(chat_request.get("messages", ())), len(chat_request.get("tools", ())), mcp_tools_added
+            )
+        
         if stream:
-            logger.info("Handling streaming response")
             # Handle streaming response
             async def stream_response():
+                # Only opening the upstream stream and reading an error body need error
+                # handling here; process_chat_completions_stream reports its own mid-stream errors
+                client = await LLMClient.get_client()
                 try:
-                    logger.info(f"Sending chat completions request with {len(chat_request.get('messages', []))} messages")
-                    client = await LLMClient.get_client()
-                    async with client.stream(
+                    upstream_request = client.build_request(
                         "POST",
                         "/v1/chat/completions",
-                        json=chat_request,
-                        timeout=120.0
-                    ) as response:
-                        logger.info(f"Stream request status: {response.status_code}")
-                        
-                        if response.status_code != 200:
-                            error_content = await response.aread()
-                            logger.error(f"Error from LLM API: {error_content}")
-                            yield f"data: {json.dumps({'type': 'error', 'error': {'message': f'Error from LLM API: {response.status_code}'}})}\n\n"
-                            return
-                        
-                        async for event in process_chat_completions_stream(response, chat_request):
-                            yield event
+                        content=orjson.dumps(chat_request),
+                        headers={"Content-Type": "application/json"}
+                    )
+                    response = await client.send(upstream_request, stream=True)
                 except Exception as e:
                     logger.error(f"Error in stream_response: {str(e)}")
-                    yield f"data: {json.dumps({'type': 'error', 'error': {'message': str(e)}})}\n\n"
+                    yield _error_frame(str(e))
+                    return
+                
+                try:
+                    logger.debug("Stream request status: %d", response.status_code)
+                    if response.status_code != 200:
+                        try:
+                            error_content = await response.aread()
+                            logger.error(f"Error from LLM API: {error_content}")
+                        except Exception as e:
+                            logger.error(f"Error reading LLM API error body: {str(e)}")
+                        yield _error_frame(f"Error from LLM API: {response.status_code}")
+                        return
+                    
+                    async for event in process_chat_completions_stream(response, chat_request):
+                        yield event
+                finally:
+                    await response.aclose()
             
             return StreamingResponse(
                 stream_response(),
-                media_type="text/event-stream"
+                media_type="text/event-stream",
+                headers=STREAM_HEADERS
             )
         
         else:
-            logger.info("Handling non-streaming response")
             # Handle non-streaming response
             try:
                 client = await LLMClient.get_client()
                 response = await client.post(
                     "/v1/chat/completions",
-                    json=chat_request,
-                    timeout=120.0
+                    json=chat_request
                 )
                 response.raise_for_status()
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 
                 # Convert chat completions response to responses API format
                 responses_response = convert_chat_completions_to_responses(response_data, chat_request)
-                return JSONResponse(content=responses_response)
+                return ORJSONResponse(content=responses_response)
                 
             except Exception as e:
                 logger.error(f"Error in non-streaming response: {str(e)}")
@@ -209,9 +176,9 @@ async def chat_completions(request: Request):
     """
     Endpoint for /v1/chat/completions, delegating to the service.
     """
-    logger.info("Handling chat completions")
+    logger.debug("Handling chat completions")
     response = await handle_chat_completions(request)
-    logger.info("Chat completions handled")
+    logger.debug("Chat completions handled")
     if isinstance(response, StreamingResponse):
         return response
     elif isinstance(response, Response):
@@ -230,12 +197,69 @@ async def health_check():
         llm_up = resp.status_code == 200
     except Exception:
         llm_up = False
-    overall = "ok" if llm_up else "degraded"
-    return {"status": overall, "adapter": "running", "llm_backend": llm_up}
+    return Response(content=HEALTH_OK_BYTES if llm_up else HEALTH_DEGRADED_BYTES, media_type="application/json")
 
 @app.get("/")
 async def root():
-    return {"message": "Open Responses Server is running."}
+    return Response(content=ROOT_RESPONSE_BYTES, media_type="application/json")
+
+# Matches a JSON "stream": true/false member; quotes inside JSON strings are escaped, so
+# this cannot match string content. The window bounds the rescan across chunk boundaries.
+_STREAM_FLAG_RE = re.compile(rb'"stream"\s*:\s*(true|false)')
+_STREAM_FLAG_MAX_LEN = 64
+
+def _is_top_level_member(body: bytearray, start: int) -> bool:
+    """
+    Returns True if nothing but the body's opening brace can nest the member at start.
+    Brackets inside strings also count, so a False result is not conclusive.
+    """
+    return body.count(b"{", 0, start) == 1 and body.count(b"[", 0, start) == 0
+
+def _is_binary_upload(request: Request) -> bool:
+    """Returns True for multipart/binary uploads, whose bodies are not JSON and need no inspection."""
+    content_type = request.headers.get("content-type", "")
+    return content_type.startswith("multipart/") or content_type.startswith("application/octet-stream")
+
+async def _peek_stream_flag(request: Request) -> tuple[bool, bytes | AsyncIterator[bytes]]:
+    """
+    Reads the request body only until its "stream" flag is visible.
+
+    Returns the flag and the content to forward: the complete body as bytes if it was
+    fully read, otherwise an iterator that replays the peeked prefix followed by the
+    rest of the body as it arrives from the client.
+    """
+    chunks = request.stream()
+    prefix = bytearray()
+    async for chunk in chunks:
+        scan_from = max(len(prefix) - _STREAM_FLAG_MAX_LEN, 0)
+        prefix += chunk
+        match = _STREAM_FLAG_RE.search(prefix, scan_from)
+        if match:
+            break
+    else:
+        # Whole body scanned without a "stream" member, so it is not a streaming request
+        return False, bytes(prefix)
+
+    if not _is_top_level_member(prefix, match.start()):
+        # The first "stream" member may belong to a nested object (e.g. metadata),
+        # so read the rest of the body and take the top-level value from a full parse
+        async for chunk in chunks:
+            prefix += chunk
+        is_stream = False
+        try:
+            request_data = orjson.loads(prefix)
+            if isinstance(request_data, dict):
+                is_stream = bool(request_data.get("stream", False))
+        except orjson.JSONDecodeError:
+            pass
+        return is_stream, bytes(prefix)
+
+    async def replay():
+        yield bytes(prefix)
+        async for chunk in chunks:
+            yield chunk
+
+    return match.group(1) == b"true", replay()
 
 @app.api_route("/{path_name:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH", "TRACE"])
 async def proxy_endpoint(request: Request, path_name: str):
@@ -243,7 +267,6 @@ async def proxy_endpoint(request: Request, path_name: str):
     A generic proxy for any other endpoints, forwarding them to the LLM backend.
     """
     client = await LLMClient.get_client()
-    body = await request.body()
     headers = {k: v for k, v in request.headers.items() if k.lower() != 'host'}
 
     try:
@@ -251,20 +274,26 @@ async def proxy_endpoint(request: Request, path_name: str):
         
         # Handle streaming for the proxy
         is_stream = False
-        if body:
-            try:
-                is_stream = json.loads(body).get("stream", False)
-            except json.JSONDecodeError:
-                pass
+        if _is_binary_upload(request):
+            # Pipe file/audio uploads to the backend as they arrive instead of buffering them
+            body = request.stream()
+        else:
+            is_stream, body = await _peek_stream_flag(request)
 
         if is_stream:
-            async def stream_proxy():
-                async with client.stream(request.method, url, headers=headers, content=body, timeout=120.0) as response:
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-            return StreamingResponse(stream_proxy(), media_type=request.headers.get('accept', 'application/json'))
+            # Hand the raw upstream bytes straight to StreamingResponse; the
+            # upstream connection is released as soon as forwarding ends.
+            # Ask for an unencoded body since raw bytes are forwarded without decoding.
+            stream_headers = {**headers, "accept-encoding": "identity"}
+            upstream_request = client.build_request(request.method, url, headers=stream_headers, content=body)
+            response = await client.send(upstream_request, stream=True)
+            return StreamingResponse(
+                aiter_raw_and_close(response),
+                media_type=request.headers.get('accept', 'application/json'),
+                headers=STREAM_HEADERS
+            )
         else:
-            response = await client.request(request.method, url, headers=headers, content=body, timeout=120.0)
+            response = await client.request(request.method, url, headers=headers, content=body)
             return Response(content=response.content, status_code=response.status_code, headers=response.headers)
             
     except Exception as e:
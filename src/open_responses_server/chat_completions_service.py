@@ -1,38 +1,138 @@
-import json
+import asyncio
+import logging
+from typing import Any
+import httpx
+import msgspec
+import orjson
 from fastapi import Request
 from fastapi.responses import StreamingResponse, Response, JSONResponse
-from open_responses_server.common.llm_client import LLMClient
-from open_responses_server.common.config import logger, OPENAI_BASE_URL_INTERNAL, MAX_TOOL_CALL_ITERATIONS, ENABLE_MCP_TOOLS
+from open_responses_server.common.llm_client import LLMClient, aiter_raw_and_close
+from open_responses_server.common.config import logger, OPENAI_BASE_URL_INTERNAL, MAX_TOOL_CALL_ITERATIONS, RAW_STREAM_PROXY, STREAM_COALESCING, CHAT_COMPLETIONS_CACHE_SIZE, CHAT_COMPLETIONS_CACHE_TTL
 from open_responses_server.common.mcp_manager import mcp_manager, serialize_tool_result
+from open_responses_server.common.response_cache import AsyncResultCache, request_cache_key, body_cache_key
+from open_responses_server.common.stream_broker import InflightStreamBroker
+from open_responses_server.common.sse import STREAM_HEADERS, chat_error_frame
+
+chat_completions_cache = AsyncResultCache(CHAT_COMPLETIONS_CACHE_SIZE, CHAT_COMPLETIONS_CACHE_TTL)
+stream_broker = InflightStreamBroker()
+
+
+class ChatCompletionsRequestView(msgspec.Struct):
+    """
+    The fields of a /v1/chat/completions request that the proxy inspects. Decoding
+    into it builds no Python objects for messages, tool schemas or unknown fields,
+    so it is only used when the raw body can be forwarded unchanged.
+    """
+    model: Any = None
+    stream: bool | None = None
+    temperature: float | None = None
+    reasoning: dict[str, Any] | None = None
+    messages: list[msgspec.Raw] = []
+    tools: list[msgspec.Raw] | None = None
+
+
+_request_view_decoder = msgspec.json.Decoder(ChatCompletionsRequestView)
+
+
+def _has_null_reasoning(reasoning: Any) -> bool:
+    """Returns True for a reasoning parameter whose values are all null."""
+    return isinstance(reasoning, dict) and all(v is None for v in reasoning.values())
+
+
+class RawProxyResponse(Response):
+    """
+    Forwards an open upstream stream to the client using raw ASGI messages,
+    skipping StreamingResponse's anyio task group and iterator wrapping.
+    Forwarding stops when the client disconnects, and the upstream response
+    is closed either way so the backend stops generating.
+    """
+
+    def __init__(self, upstream: httpx.Response, media_type: str = "text/event-stream", headers: dict | None = None):
+        self.upstream = upstream
+        self.status_code = 200
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+
+    async def _relay(self, send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        async for chunk in self.upstream.aiter_raw():
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    @staticmethod
+    async def _wait_for_disconnect(receive) -> None:
+        # The request body has already been read, so the next message is the disconnect
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    async def __call__(self, scope, receive, send) -> None:
+        # send() returns silently once the client is gone (ASGI spec < 2.4),
+        # so the disconnect has to be watched for separately
+        relay = asyncio.create_task(self._relay(send))
+        disconnect = asyncio.create_task(self._wait_for_disconnect(receive))
+        try:
+            done, _ = await asyncio.wait((relay, disconnect), return_when=asyncio.FIRST_COMPLETED)
+            if relay in done:
+                relay.result()
+            else:
+                logger.debug("[CHAT-COMPLETIONS-STREAM] Client disconnected, closing upstream stream")
+        finally:
+            relay.cancel()
+            disconnect.cancel()
+            await asyncio.gather(relay, disconnect, return_exceptions=True)
+            await self.upstream.aclose()
+
 
 async def _handle_non_streaming_request(client: LLMClient, request_data: dict):
     """Handles a non-streaming chat completions request - simple passthrough."""
     current_request_data = request_data.copy()
     
     # Remove reasoning parameter if it has null values
-    if "reasoning" in current_request_data:
-        reasoning = current_request_data["reasoning"]
-        if isinstance(reasoning, dict) and all(v is None for v in reasoning.values()):
-            current_request_data.pop("reasoning", None)
-            logger.info("[CHAT-COMPLETIONS-NON-STREAM] Removed reasoning parameter with null values")
+    if _has_null_reasoning(current_request_data.get("reasoning")):
+        current_request_data.pop("reasoning", None)
+        logger.debug("[CHAT-COMPLETIONS-NON-STREAM] Removed reasoning parameter with null values")
     
     # Make a single request to vLLM and return the result
     current_request_data.pop("stream", None)
 
+    cache_key = None
+    if current_request_data.get("temperature") == 0:
+        cache_key = request_cache_key(current_request_data)
+    return await _cached_chat_completion(client, orjson.dumps(current_request_data), cache_key)
+
+
+async def _cached_chat_completion(client: LLMClient, body: bytes, cache_key: bytes | None = None) -> dict:
+    """
+    Returns the chat completion for a non-streaming request body.
+    Deterministic requests given a cache_key are served from the result cache, and
+    identical concurrent requests share a single upstream call.
+    """
+    if cache_key is not None and chat_completions_cache.maxsize > 0:
+        return await chat_completions_cache.get_or_compute(
+            cache_key,
+            lambda: _post_chat_completion(client, body),
+            cacheable=lambda response_data: "error" not in response_data
+        )
+    return await _post_chat_completion(client, body)
+
+
+async def _post_chat_completion(client: LLMClient, body: bytes) -> dict:
+    """Sends a non-streaming chat completions body upstream and returns the parsed response."""
     try:
         response = await client.post(
             "/v1/chat/completions",
-            json=current_request_data,
-            timeout=120.0
+            content=body,
+            headers={"Content-Type": "application/json"}
         )
         response.raise_for_status()
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         
         choice = response_data.get("choices", [])[0]
         
         if choice.get("finish_reason") == "tool_calls":
             tool_calls = choice.get("message", {}).get("tool_calls", [])
-            logger.info(f"[CHAT-COMPLETIONS-NON-STREAM] Returning {len(tool_calls)} tool calls to client for execution")
+            logger.debug("[CHAT-COMPLETIONS-NON-STREAM] Returning %d tool calls to client for execution", len(tool_calls))
         
         # Return the response data directly - let client handle tool execution
         return response_data
@@ -42,34 +142,90 @@ async def _handle_non_streaming_request(client: LLMClient, request_data: dict):
         return {"error": str(e)}
 
 
-async def _handle_streaming_request(client: LLMClient, request_data: dict) -> StreamingResponse:
-    """Handles a streaming chat completions request - simple passthrough."""
+async def _handle_streaming_request(client: LLMClient, request_data: dict, raw_body: bytes | None = None) -> Response:
+    """
+    Handles a streaming chat completions request - simple passthrough.
+    raw_body is the client's original JSON body; it is sent as-is when request_data
+    needs no changes, skipping re-serialization.
+    """
     stream_request_data = request_data.copy()
     stream_request_data["stream"] = True
 
     # Remove reasoning parameter if it has null values
-    if "reasoning" in stream_request_data:
-        reasoning = stream_request_data["reasoning"]
-        if isinstance(reasoning, dict) and all(v is None for v in reasoning.values()):
-            stream_request_data.pop("reasoning", None)
-            logger.info("[CHAT-COMPLETIONS-STREAM] Removed reasoning parameter with null values")
-
-    # Just proxy the stream directly - no tool call processing
-    async def stream_proxy():
-        try:
-            async with client.stream(
-                "POST",
-                "/v1/chat/completions",
-                json=stream_request_data,
-                timeout=120.0
-            ) as stream_response:
-                async for chunk in stream_response.aiter_bytes():
-                    yield chunk
-        except Exception as e:
-            logger.error(f"Error during chat completions stream proxy: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n".encode()
+    if _has_null_reasoning(stream_request_data.get("reasoning")):
+        stream_request_data.pop("reasoning", None)
+        raw_body = None
+        logger.debug("[CHAT-COMPLETIONS-STREAM] Removed reasoning parameter with null values")
+
+    if raw_body is None or request_data.get("stream") is not True:
+        raw_body = orjson.dumps(stream_request_data)
+
+    coalesce_key = None
+    if STREAM_COALESCING and stream_request_data.get("temperature") == 0:
+        coalesce_key = request_cache_key(stream_request_data)
+    return await _proxy_stream(client, raw_body, coalesce_key)
+
+
+async def _proxy_stream(client: LLMClient, body: bytes, coalesce_key: bytes | None = None) -> Response:
+    """
+    Sends a streaming chat completions body upstream and relays the raw event stream.
+    Requests given the same coalesce_key while one is in flight share its upstream stream.
+    """
+    upstream_request = client.build_request(
+        "POST",
+        "/v1/chat/completions",
+        content=body,
+        headers={"Accept-Encoding": "identity", "Content-Type": "application/json"}
+    )
+
+    # Identical deterministic requests in flight share one upstream stream
+    if coalesce_key is not None:
+        shared_stream = stream_broker.subscribe(coalesce_key, lambda: client.send(upstream_request, stream=True))
+        return StreamingResponse(shared_stream, media_type="text/event-stream", headers=STREAM_HEADERS)
+
+    # Just proxy the stream directly - no tool call processing. The upstream
+    # bytes are handed straight to StreamingResponse and the connection is
+    # released as soon as forwarding ends, whether or not it succeeded.
+    try:
+        stream_response = await client.send(upstream_request, stream=True)
+    except Exception as e:
+        logger.error(f"Error during chat completions stream proxy: {e}")
+        return StreamingResponse(iter([chat_error_frame(str(e))]), media_type="text/event-stream", headers=STREAM_HEADERS)
+
+    if RAW_STREAM_PROXY:
+        return RawProxyResponse(stream_response, headers=STREAM_HEADERS)
+
+    return StreamingResponse(
+        aiter_raw_and_close(stream_response),
+        media_type="text/event-stream",
+        headers=STREAM_HEADERS
+    )
+
 
-    return StreamingResponse(stream_proxy(), media_type="text/event-stream")
+def _log_request_summary(model: Any, stream: Any, messages: int, tools: int, mcp_tools_added: int) -> None:
+    """Logs the one summary event per request; arguments are only formatted if a handler emits it."""
+    logger.info(
+        "[CHAT-COMPLETIONS] model=%s stream=%s messages=%d tools=%d mcp_tools_added=%d",
+        model, stream, messages, tools, mcp_tools_added
+    )
+
+
+def _raw_forward_view(raw_body: bytes) -> ChatCompletionsRequestView | None:
+    """
+    Returns the inspected fields of a request whose raw body can be forwarded unchanged,
+    or None if it must be parsed and rewritten (MCP tool injection, null reasoning, or
+    fields that don't fit the view).
+    """
+    # Injection rewrites every request, so skip the view decode and parse only once
+    if mcp_manager.injects_chat_tools():
+        return None
+    try:
+        view = _request_view_decoder.decode(raw_body)
+    except msgspec.DecodeError:
+        return None
+    if _has_null_reasoning(view.reasoning):
+        return None
+    return view
 
 
 async def handle_chat_completions(request: Request):
@@ -78,39 +234,36 @@ async def handle_chat_completions(request: Request):
     Injects MCP tools and proxies the request to the underlying LLM API.
     """
     client = await LLMClient.get_client()
-    request_data = await request.json()
+    raw_body = await request.body()
+
+    # Fast path: a request that needs no rewriting is forwarded from its raw body
+    # after decoding only the fields inspected here
+    view = _raw_forward_view(raw_body)
+    if view is not None:
+        _log_request_summary(view.model, view.stream, len(view.messages), len(view.tools or ()), 0)
+        cache_key = body_cache_key(raw_body) if view.temperature == 0 else None
+        if view.stream:
+            return await _proxy_stream(client, raw_body, cache_key if STREAM_COALESCING else None)
+        return await _cached_chat_completion(client, raw_body, cache_key)
+
+    request_data = orjson.loads(raw_body)
 
-    logger.info("[CHAT-COMPLETIONS] Processing /v1/chat/completions request")
-    
     # Inject MCP tools into the request
-    mcp_tools = mcp_manager.get_mcp_tools()
-    if mcp_tools and ENABLE_MCP_TOOLS:
-        existing_tools = request_data.get("tools", [])
-        existing_tool_names = {tool.get("function", {}).get("name") for tool in existing_tools}
-        
-        logger.info(f"[CHAT-COMPLETIONS] Found {len(mcp_tools)} MCP tools available")
-        logger.info(f"[CHAT-COMPLETIONS] Request has {len(existing_tools)} existing tools: {list(existing_tool_names)}")
-        
-        added_tools = []
-        for tool in mcp_tools:
-            if tool.get("name") not in existing_tool_names:
-                existing_tools.append({"type": "function", "function": tool})
-                added_tools.append(tool.get("name"))
-        
-        request_data["tools"] = existing_tools
-        
-        logger.info(f"[CHAT-COMPLETIONS] Added {len(added_tools)} MCP tools: {added_tools}")
-        logger.info(f"[CHAT-COMPLETIONS] Final tool count: {len(existing_tools)}")
-    else:
-        logger.info("[CHAT-COMPLETIONS] No MCP tools available to inject or MCP tools disabled.")
+    mcp_tools_added = mcp_manager.inject_chat_tools(request_data)
     
-    logger.debug(f"[CHAT-COMPLETIONS] Final tools in request: {request_data.get('tools', [])}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[CHAT-COMPLETIONS] Final tools in request: %s", request_data.get("tools", []))
 
     # Determine if the request is streaming
     is_stream = request_data.get("stream", False)
-    logger.info(f"[CHAT-COMPLETIONS] Request streaming mode: {is_stream}")
+    
+    _log_request_summary(
+        request_data.get("model"), is_stream, len(request_data.get("messages", ())),
+        len(request_data.get("tools") or ()), mcp_tools_added
+    )
 
     if is_stream:
-        return await _handle_streaming_request(client, request_data)
+        # The client's body can be forwarded verbatim unless MCP injection rewrote it
+        return await _handle_streaming_request(client, request_data, raw_body if mcp_tools_added == 0 else None)
     else:
         return await _handle_non_streaming_request(client, request_data) 
\ No newline at end of file
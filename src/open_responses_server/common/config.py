@@ -1,5 +1,8 @@
 import os
+import queue
+import atexit
 import logging
+import logging.handlers
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -28,11 +31,34 @@ MAX_TOOL_CALL_ITERATIONS = int(os.environ.get("MAX_TOOL_CALL_ITERATIONS", "25"))
 # tool injection.
 ENABLE_MCP_TOOLS = os.environ.get("ENABLE_MCP_TOOLS", "false").lower() in ("1", "true", "yes")
 
+# Streaming /v1/chat/completions passthrough writes upstream chunks straight to the ASGI
+# send channel. Set RAW_STREAM_PROXY=false to fall back to Starlette's StreamingResponse.
+RAW_STREAM_PROXY = os.environ.get("RAW_STREAM_PROXY", "true").lower() in ("1", "true", "yes")
+
+# Result cache for non-streaming /v1/chat/completions requests. Only deterministic requests
+# (temperature == 0) are cached. Set CHAT_COMPLETIONS_CACHE_SIZE=0 to disable caching.
+CHAT_COMPLETIONS_CACHE_SIZE = int(os.environ.get("CHAT_COMPLETIONS_CACHE_SIZE", "1024"))
+CHAT_COMPLETIONS_CACHE_TTL = float(os.environ.get("CHAT_COMPLETIONS_CACHE_TTL", "300"))
+
+# Concurrent identical deterministic (temperature == 0) streaming /v1/chat/completions requests
+# share a single upstream stream. Set STREAM_COALESCING=false to give each its own stream.
+STREAM_COALESCING = os.environ.get("STREAM_COALESCING", "true").lower() in ("1", "true", "yes")
+
 
 # --- Logging Configuration ---
 
+log_listener: logging.handlers.QueueListener | None = None
+_log_listener_running = False
+
 def setup_logging():
-    """Configures the global logger."""
+    """
+    Configures the global logger.
+
+    Records are formatted by a QueueHandler on the calling thread and written to the
+    file/console handlers by a QueueListener thread, so logging from request handlers
+    never blocks the event loop on I/O.
+    """
+    global log_listener
     log_dir = "./log"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -41,18 +67,39 @@ def setup_logging():
     log_level_str = os.environ.get("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, log_level_str, logging.INFO)
 
+    log_queue = queue.SimpleQueue()
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(os.path.join(log_dir, "api_adapter.log")),
-            logging.StreamHandler()
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
+    # Records arrive already formatted by the QueueHandler
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler(os.path.join(log_dir, "api_adapter.log")),
+        logging.StreamHandler()
+    )
+    start_log_listener()
+    atexit.register(stop_log_listener)
+
     logger = logging.getLogger("api_adapter")
     logger.info(f"Logging configured. Level={logging.getLevelName(level)}")
     return logger
 
+def start_log_listener():
+    """Starts the background thread that writes queued log records, if not running."""
+    global _log_listener_running
+    if log_listener is not None and not _log_listener_running:
+        log_listener.start()
+        _log_listener_running = True
+
+def stop_log_listener():
+    """Flushes queued log records and stops the background logging thread."""
+    global _log_listener_running
+    if log_listener is not None and _log_listener_running:
+        log_listener.stop()
+        _log_listener_running = False
+
 # Initialize logging
 logger = setup_logging()
 
@@ -64,4 +111,8 @@ logger.info(f"  API_ADAPTER_PORT: {API_ADAPTER_PORT}")
 logger.info(f"  MCP_TOOL_REFRESH_INTERVAL: {MCP_TOOL_REFRESH_INTERVAL}")
 logger.info(f"  MCP_SERVERS_CONFIG_PATH: {MCP_SERVERS_CONFIG_PATH}")
 logger.info(f"  MAX_CONVERSATION_HISTORY: {MAX_CONVERSATION_HISTORY}")
-logger.info(f"  MAX_TOOL_CALL_ITERATIONS: {MAX_TOOL_CALL_ITERATIONS}") 
\ No newline at end of file
+logger.info(f"  MAX_TOOL_CALL_ITERATIONS: {MAX_TOOL_CALL_ITERATIONS}")
+logger.info(f"  RAW_STREAM_PROXY: {RAW_STREAM_PROXY}")
+logger.info(f"  CHAT_COMPLETIONS_CACHE_SIZE: {CHAT_COMPLETIONS_CACHE_SIZE}")
+logger.info(f"  CHAT_COMPLETIONS_CACHE_TTL: {CHAT_COMPLETIONS_CACHE_TTL}")
+logger.info(f"  STREAM_COALESCING: {STREAM_COALESCING}") 
\ No newline at end of file
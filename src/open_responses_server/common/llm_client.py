@@ -1,6 +1,22 @@
+import importlib.util
+from typing import AsyncIterator
 import httpx
 from .config import OPENAI_BASE_URL_INTERNAL, logger
 
+# HTTP/2 requires the optional "h2" package (installed with httpx[http2]).
+# It is negotiated via ALPN, so plain-http backends keep using HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Keep-alive pool sized for concurrent streaming requests so that bursts
+# reuse connections instead of paying a new TCP/TLS handshake each time.
+LLM_CLIENT_LIMITS = httpx.Limits(
+    max_connections=512,
+    max_keepalive_connections=256,
+    keepalive_expiry=60
+)
+# Applies to every request; a bare per-call timeout would replace the connect limit too.
+LLM_CLIENT_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
 class LLMClient:
     """
     An asynchronous client for interacting with the LLM API.
@@ -14,10 +30,12 @@ class LLMClient:
         Initializes it if it doesn't exist.
         """
         if cls._client is None:
-            logger.info(f"Initializing LLM client... ({OPENAI_BASE_URL_INTERNAL})")
+            logger.info(f"Initializing LLM client... ({OPENAI_BASE_URL_INTERNAL}, http2={HTTP2_AVAILABLE})")
             cls._client = httpx.AsyncClient(
                 base_url=OPENAI_BASE_URL_INTERNAL,
-                timeout=httpx.Timeout(120.0)
+                http2=HTTP2_AVAILABLE,
+                limits=LLM_CLIENT_LIMITS,
+                timeout=LLM_CLIENT_TIMEOUT
             )
         return cls._client
 
@@ -31,6 +49,17 @@ class LLMClient:
             await cls._client.aclose()
             cls._client = None
 
+async def aiter_raw_and_close(response: httpx.Response) -> AsyncIterator[bytes]:
+    """
+    Yields the raw bytes of a streamed response and closes it afterwards,
+    including when the upstream fails mid-stream.
+    """
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
 # You can also define helper functions to use the client, as per the plan.
 # For now, we'll just provide the client management.
 
@@ -6,12 +6,12 @@ import shutil
 import traceback
 from pathlib import Path
 from contextlib import AsyncExitStack
-from typing import Dict, List, Any
+from typing import Dict, List, Tuple, Any
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-from .config import MCP_TOOL_REFRESH_INTERVAL, MCP_SERVERS_CONFIG_PATH, logger
+from .config import MCP_TOOL_REFRESH_INTERVAL, MCP_SERVERS_CONFIG_PATH, ENABLE_MCP_TOOLS, logger
 
 class MCPServer:
     """Wrapper for an MCP server session and tool execution."""
@@ -84,6 +84,10 @@ class MCPManager:
     def __init__(self):
         self.mcp_servers: List[MCPServer] = []
         self.mcp_functions_cache: List[Dict[str, Any]] = []
+        # Derived from mcp_functions_cache on each refresh so request handlers don't rebuild them
+        # Shared between requests and sent as-is, so the entries must never be mutated
+        self._tools_chatfmt: Tuple[Dict[str, Any], ...] = ()  # chat.completions "tools" entries
+        self._tool_names: frozenset = frozenset()
         self._refresh_task: asyncio.Task | None = None
         self._server_tool_mapping: Dict[str, str] = {}  # tool_name -> server_name mapping
 
@@ -188,6 +192,8 @@ class MCPManager:
         # Update cache
         old_count = len(self.mcp_functions_cache)
         self.mcp_functions_cache = new_cache
+        self._tools_chatfmt = tuple({"type": "function", "function": f} for f in new_cache)
+        self._tool_names = frozenset(f["name"] for f in new_cache)
         new_count = len(self.mcp_functions_cache)
         
         # Log detailed refresh results
@@ -215,11 +221,42 @@ class MCPManager:
         logger.debug(f"[MCP-GET-TOOLS] Returning {tool_count} cached MCP tools: {tool_names}")
         return self.mcp_functions_cache
 
+    def injects_chat_tools(self) -> bool:
+        """Returns True if inject_chat_tools may add MCP tools to requests."""
+        return ENABLE_MCP_TOOLS and bool(self._tools_chatfmt)
+
+    def inject_chat_tools(self, chat_request: dict) -> int:
+        """
+        Appends the cached MCP tools to a chat.completions request. Tools already in the
+        request keep priority on name conflicts, and legacy "functions" are left as they are.
+        The request is left untouched when no MCP tool is added.
+        Returns the number of MCP tools added.
+        """
+        if not self.injects_chat_tools():
+            return 0
+
+        tools = chat_request.get("tools") or []
+        tool_names = {
+            tool["function"].get("name") if "function" in tool else tool.get("name")
+            for tool in tools if isinstance(tool, dict)
+        }
+        new_tools = []
+        for tool in self._tools_chatfmt:
+            name = tool["function"]["name"]
+            if name not in tool_names:
+                new_tools.append(tool)
+                tool_names.add(name)
+
+        if new_tools:
+            chat_request["tools"] = tools + new_tools
+        logger.debug("[MCP-INJECT] Added %d MCP tools to chat request", len(new_tools))
+        return len(new_tools)
+
     def is_mcp_tool(self, tool_name: str) -> bool:
         """Determines if the given tool name belongs to an MCP tool."""
-        is_mcp = any(func.get("name") == tool_name for func in self.mcp_functions_cache)
+        is_mcp = tool_name in self._tool_names
         server_name = self._server_tool_mapping.get(tool_name, "unknown")
-        logger.debug(f"[MCP-CHECK] Tool '{tool_name}': is_mcp={is_mcp}, server='{server_name}'")
+        logger.debug("[MCP-CHECK] Tool '%s': is_mcp=%s, server='%s'", tool_name, is_mcp, server_name)
         return is_mcp
 
     async def execute_mcp_tool(self, tool_name: str, arguments: dict) -> Any:
@@ -0,0 +1,85 @@
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+from .config import logger
+
+# Marks a coalesced computation that failed, so waiters compute the value themselves
+_FAILED = object()
+
+
+def request_cache_key(request_data: dict) -> bytes:
+    """Returns a stable digest of a JSON request payload, independent of key order."""
+    return hashlib.blake2b(orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+
+def body_cache_key(body: bytes) -> bytes:
+    """Returns a digest of a raw request body, for callers that never decode it fully."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class AsyncResultCache:
+    """
+    An LRU cache with per-entry TTL for results of async computations.
+
+    Concurrent lookups of the same missing key are coalesced: the first caller runs the
+    computation and the others wait for its result instead of starting their own.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future] = {}
+
+    async def get_or_compute(
+        self,
+        key: bytes,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """
+        Returns the cached value for key, or awaits compute() and caches its result
+        if cacheable(result) is true.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                logger.debug("[RESULT-CACHE] Hit for key %s", key.hex())
+                return value
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("[RESULT-CACHE] Waiting for in-flight computation of key %s", key.hex())
+            value = await asyncio.shield(inflight)
+            if value is not _FAILED:
+                return value
+            return await compute()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except BaseException:
+            future.set_result(_FAILED)
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(value)
+        if cacheable(value):
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drops all cached entries."""
+        self._entries.clear()
@@ -0,0 +1,12 @@
+import orjson
+
+# Disable reverse-proxy buffering (e.g. nginx) so SSE chunks reach the client immediately
+STREAM_HEADERS = {"X-Accel-Buffering": "no"}
+
+# SSE error frame envelope used on relayed chat completions streams
+CHAT_ERROR_FRAME_PREFIX = b'data: {"error":'
+CHAT_ERROR_FRAME_SUFFIX = b'}\n\n'
+
+def chat_error_frame(message: str) -> bytes:
+    """Returns a chat completions SSE error frame for the given message."""
+    return CHAT_ERROR_FRAME_PREFIX + orjson.dumps(message) + CHAT_ERROR_FRAME_SUFFIX
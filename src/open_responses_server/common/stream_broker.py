@@ -0,0 +1,85 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+from .config import logger
+from .sse import chat_error_frame
+
+
+class _SharedStream:
+    """One upstream stream and the queues of the clients subscribed to it."""
+
+    def __init__(self, key: bytes):
+        self.key = key
+        self.history: list[bytes] = []
+        self.subscribers: list[asyncio.Queue] = []
+        self.task: asyncio.Task | None = None
+
+
+class InflightStreamBroker:
+    """
+    Shares a single upstream stream between concurrent identical streaming requests.
+
+    The first request for a key opens the upstream stream in a producer task that
+    broadcasts every chunk to all subscriber queues. Requests arriving while that
+    stream is in flight subscribe to it and first receive the chunks already sent.
+    The upstream stream is cancelled once every subscriber has gone away.
+    """
+
+    def __init__(self):
+        self._streams: dict[bytes, _SharedStream] = {}
+
+    def subscribe(self, key: bytes, open_upstream: Callable[[], Awaitable[httpx.Response]]) -> AsyncIterator[bytes]:
+        """Returns an iterator over the shared stream for key, opening it if needed."""
+        shared = self._streams.get(key)
+        if shared is None:
+            shared = self._streams[key] = _SharedStream(key)
+            shared.task = asyncio.create_task(self._produce(shared, open_upstream))
+        else:
+            logger.debug("[STREAM-BROKER] Joining in-flight stream for key %s", key.hex())
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in shared.history:
+            queue.put_nowait(chunk)
+        shared.subscribers.append(queue)
+        return self._consume(shared, queue)
+
+    async def _produce(self, shared: _SharedStream, open_upstream: Callable[[], Awaitable[httpx.Response]]) -> None:
+        try:
+            response = await open_upstream()
+            try:
+                async for chunk in response.aiter_raw():
+                    shared.history.append(chunk)
+                    for queue in shared.subscribers:
+                        queue.put_nowait(chunk)
+            finally:
+                await response.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[STREAM-BROKER] Error in shared upstream stream: {e}")
+            error_frame = chat_error_frame(str(e))
+            for queue in shared.subscribers:
+                queue.put_nowait(error_frame)
+        finally:
+            # New identical requests start a fresh upstream stream from here on
+            self._detach(shared)
+            for queue in shared.subscribers:
+                queue.put_nowait(None)
+
+    def _detach(self, shared: _SharedStream) -> None:
+        if self._streams.get(shared.key) is shared:
+            del self._streams[shared.key]
+
+    async def _consume(self, shared: _SharedStream, queue: asyncio.Queue) -> AsyncIterator[bytes]:
+        try:
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+        finally:
+            shared.subscribers.remove(queue)
+            if not shared.subscribers and shared.task is not None:
+                # Detach first so a request arriving while the upstream closes
+                # opens a new stream rather than joining this truncated one
+                self._detach(shared)
+                shared.task.cancel()
@@ -1,4 +1,6 @@
 import json
+import orjson
+import logging
 import uuid
 import time
 from typing import Dict, List, Any
@@ -59,7 +61,7 @@ def convert_chat_completions_to_responses(chat_response: dict, chat_request: dic
     
     if reasoning_content:
         reasoning_summary = reasoning_content[:200] + "..." if len(reasoning_content) > 200 else reasoning_content
-        logger.info(f"Extracted reasoning content for non-streaming: {len(reasoning_content)} chars")
+        logger.debug("Extracted reasoning content for non-streaming: %s chars", len(reasoning_content))
     
     # Build output array
     output_items = []
@@ -147,7 +149,7 @@ def convert_chat_completions_to_responses(chat_response: dict, chat_request: dic
             "content": content
         })
         conversation_history[response_id] = messages
-        logger.info(f"Saved conversation history for response_id {response_id} with {len(messages)} messages")
+        logger.debug("Saved conversation history for response_id %s with %s messages", response_id, len(messages))
     
     return response_obj
 
@@ -190,7 +192,7 @@ def validate_message_sequence(messages: List[Dict[str, Any]]) -> List[Dict[str,
             if has_preceding_tool_call:
                 validated_messages.append(message)
                 seen_tool_call_ids.add(tool_call_id)
-                logger.debug(f"Valid tool message at position {i}: call_id={tool_call_id}")
+                logger.debug("Valid tool message at position %s: call_id=%s", i, tool_call_id)
             else:
                 logger.warning(f"Orphaned tool message at position {i}: call_id={tool_call_id} - no preceding assistant with matching tool_call")
                 orphaned_tool_messages.append(message)
@@ -200,7 +202,7 @@ def validate_message_sequence(messages: List[Dict[str, Any]]) -> List[Dict[str,
     if orphaned_tool_messages:
         logger.warning(f"Removed {len(orphaned_tool_messages)} orphaned tool messages to prevent API validation error")
         
-    logger.info(f"Message validation: {len(messages)} -> {len(validated_messages)} messages")
+    logger.debug("Message validation: %s -> %s messages", len(messages), len(validated_messages))
     return validated_messages
 
 def convert_responses_to_chat_completions(request_data: dict) -> dict:
@@ -208,10 +210,9 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
     Convert a request in Responses API format to chat.completions API format.
     """
     # Log only essential info - model, tools count, if instructions present
-    logger.info(f"Request: model={request_data.get('model')}, " +
-                f"tools={len(request_data.get('tools', []))}, " +
-                f"has_instructions={'instructions' in request_data}")
-    logger.info(f"Tools in request={request_data.get('tools', [])}")
+    logger.debug("Request: model=%s, tools=%s, has_instructions=%s", request_data.get('model'), len(request_data.get('tools', [])), 'instructions' in request_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tools in request=%s", request_data.get('tools', []))
     
     chat_request = {
         "model": request_data.get("model"),
@@ -230,9 +231,9 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
     # Check for previous_response_id and load conversation history if available
     previous_response_id = request_data.get("previous_response_id")
     if previous_response_id and previous_response_id in conversation_history:
-        logger.info(f"Loading conversation history from previous_response_id: {previous_response_id}")
+        logger.debug("Loading conversation history from previous_response_id: %s", previous_response_id)
         messages = conversation_history[previous_response_id].copy()
-        logger.info(f"Loaded {len(messages)} messages from conversation history")
+        logger.debug("Loaded %s messages from conversation history", len(messages))
     
     # Check for system message first if we have instructions
     if "instructions" in request_data:
@@ -240,19 +241,20 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
         has_system_message = any(msg.get("role") == "system" for msg in messages)
         if not has_system_message:
             messages.append({"role": "system", "content": request_data["instructions"]})
-            logger.info(f"Added system message from instructions")
+            logger.debug("Added system message from instructions")
         else:
             # Replace existing system message with the new instructions
             for msg in messages:
                 if msg.get("role") == "system":
                     msg["content"] = request_data["instructions"]
-                    logger.info(f"Updated existing system message with new instructions")
+                    logger.debug("Updated existing system message with new instructions")
                     break
     
     # Check for previous tool responses in the input
     if "input" in request_data and request_data["input"]:
         user_message = {"role": "user", "content": ""}
-        logger.info(f"Processing input messages {request_data['input']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing input messages %s", request_data['input'])
         for i, item in enumerate(request_data["input"]):
             if isinstance(item, dict):
                 if item.get("type") == "message" and item.get("role") == "user":
@@ -269,12 +271,13 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                     user_message = {"role": "user", "content": content}
                     messages.append(user_message)
                     # Log user message content for context
-                    logger.info(f"User message: {content[:100]}...")
+                    logger.debug("User message: %s...", content[:100])
                     
                 elif item.get("type") == "function_call_output":
                     # Add tool output - log tool usage
-                    logger.info(f"[TOOL-OUTPUT-PROCESSING] Processing function_call_output: call_id={item.get('call_id')}, output={item.get('output', '')[:50]}...")
-                    logger.info(f"[TOOL-OUTPUT-PROCESSING] Full item: {json.dumps(item, indent=2)}")
+                    logger.debug("[TOOL-OUTPUT-PROCESSING] Processing function_call_output: call_id=%s, output=%s...", item.get('call_id'), item.get('output', '')[:50])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[TOOL-OUTPUT-PROCESSING] Full item: %s", json.dumps(item, indent=2))
                     
                     # Check if we have a corresponding assistant message with a tool call first
                     call_id = item.get("call_id")
@@ -289,11 +292,12 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                                     break
                     
                     # Debug: Log messages structure for debugging
-                    logger.info(f"[TOOL-OUTPUT-PROCESSING] Messages so far: {len(messages)} messages")
-                    for i, msg in enumerate(messages):
-                        logger.info(f"[TOOL-OUTPUT-PROCESSING] Message {i}: role={msg.get('role')}, has_tool_calls={'tool_calls' in msg}")
-                        if msg.get("role") == "tool":
-                            logger.info(f"[TOOL-OUTPUT-PROCESSING] Tool message {i}: call_id={msg.get('tool_call_id')}")
+                    logger.debug("[TOOL-OUTPUT-PROCESSING] Messages so far: %s messages", len(messages))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for i, msg in enumerate(messages):
+                            logger.debug("[TOOL-OUTPUT-PROCESSING] Message %s: role=%s, has_tool_calls=%s", i, msg.get('role'), 'tool_calls' in msg)
+                            if msg.get("role") == "tool":
+                                logger.debug("[TOOL-OUTPUT-PROCESSING] Tool message %s: call_id=%s", i, msg.get('tool_call_id'))
                     
                     if has_matching_tool_call:
                         # Only add the tool response if we found a matching tool call
@@ -303,7 +307,7 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                             "content": item.get("output", "")
                         }
                         messages.append(tool_message)
-                        logger.info(f"[TOOL-OUTPUT-PROCESSING] Added tool response for existing tool call {call_id}")
+                        logger.debug("[TOOL-OUTPUT-PROCESSING] Added tool response for existing tool call %s", call_id)
                     else:
                         # If no matching tool call, we need to add an assistant message with the tool call first
                         # as this could be from a previous conversation
@@ -336,7 +340,7 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                             "content": item.get("output", "")
                         }
                         messages.append(tool_message)
-                        logger.info(f"[TOOL-OUTPUT-PROCESSING] Added assistant message with tool call and corresponding tool response for {tool_name}")
+                        logger.debug("[TOOL-OUTPUT-PROCESSING] Added assistant message with tool call and corresponding tool response for %s", tool_name)
                 elif item.get("type") == "message" and item.get("role") == "assistant":
                     # Handle assistant messages from previous conversations
                     content = ""
@@ -347,11 +351,11 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                     
                     if content:
                         messages.append({"role": "assistant", "content": content})
-                        logger.info(f"Added assistant message: {content[:100]}...")
+                        logger.debug("Added assistant message: %s...", content[:100])
             elif isinstance(item, str):
                 # Simple string input
                 messages.append({"role": "user", "content": item})
-                logger.info(f"User message (string): {item[:100]}...")
+                logger.debug("User message (string): %s...", item[:100])
     
     # If we only have a system message or no messages at all, add an empty user message
     if not messages or (len(messages) == 1 and messages[0]["role"] == "system"):
@@ -363,11 +367,11 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
     if "tools" in request_data and request_data["tools"]:
         chat_request["tools"] = []
         
-        logger.info(f"[TOOL-CONVERSION] Processing {len(request_data['tools'])} tools from request_data")
+        logger.debug("[TOOL-CONVERSION] Processing %s tools from request_data", len(request_data['tools']))
         
         for i, tool in enumerate(request_data["tools"]):
             try:
-                logger.debug(f"[TOOL-CONVERSION] Processing tool {i}: {tool}")
+                logger.debug("[TOOL-CONVERSION] Processing tool %s: %s", i, tool)
                 if not isinstance(tool, dict) or "type" not in tool or tool.get("type") != "function":
                     logger.warning(f"[TOOL-CONVERSION] Skipping tool {i}: not a function type or invalid format")
                     continue
@@ -382,7 +386,7 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                 }
                 
                 # Log tool information
-                logger.info(f"[TOOL-CONVERSION] Converting Tool {i}: {function_data['name']}")
+                logger.debug("[TOOL-CONVERSION] Converting Tool %s: %s", i, function_data['name'])
                 
                 if "description" in function_obj:
                     function_data["description"] = function_obj["description"]
@@ -396,15 +400,15 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
                 })
                 
                 # Check if this is an MCP tool
-                is_mcp = any(func.get("name") == function_data["name"] for func in mcp_manager.mcp_functions_cache)
-                logger.info(f"[TOOL-CONVERSION] Tool '{function_data['name']}': is_mcp={is_mcp}")
+                is_mcp = mcp_manager.is_mcp_tool(function_data["name"])
+                logger.debug("[TOOL-CONVERSION] Tool '%s': is_mcp=%s", function_data['name'], is_mcp)
                 
             except Exception as e:
                 logger.error(f"[TOOL-CONVERSION] Error processing tool {i}: {str(e)}")
         
-        logger.info(f"[TOOL-CONVERSION] Successfully converted {len(chat_request['tools'])} tools to chat_request format")
+        logger.debug("[TOOL-CONVERSION] Successfully converted %s tools to chat_request format", len(chat_request['tools']))
     else:
-        logger.info("[TOOL-CONVERSION] No tools found in request_data")
+        logger.debug("[TOOL-CONVERSION] No tools found in request_data")
     
     # Handle tool_choice
     if "tool_choice" in request_data:
@@ -416,9 +420,9 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
         # Only include reasoning if it has actual non-null values
         if isinstance(reasoning, dict) and any(v is not None for v in reasoning.values()):
             chat_request["reasoning"] = reasoning
-            logger.info(f"[TOOL-CONVERSION] Including reasoning parameter: {reasoning}")
+            logger.debug("[TOOL-CONVERSION] Including reasoning parameter: %s", reasoning)
         else:
-            logger.info("[TOOL-CONVERSION] Skipping reasoning parameter (all values are null)")
+            logger.debug("[TOOL-CONVERSION] Skipping reasoning parameter (all values are null)")
     
     # Add optional parameters if they exist
     for key in ["user", "metadata"]:
@@ -430,10 +434,10 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
         reasoning = chat_request["reasoning"]
         if isinstance(reasoning, dict) and all(v is None for v in reasoning.values()):
             chat_request.pop("reasoning", None)
-            logger.info("[TOOL-CONVERSION] Removed reasoning parameter with all null values from chat_request")
+            logger.debug("[TOOL-CONVERSION] Removed reasoning parameter with all null values from chat_request")
     
     # Log final chat_request for debugging
-    logger.info(f"[TOOL-CONVERSION] Final chat_request keys: {list(chat_request.keys())}")
+    logger.debug("[TOOL-CONVERSION] Final chat_request keys: %s", list(chat_request.keys()))
     if "reasoning" in chat_request:
         logger.warning(f"[TOOL-CONVERSION] WARNING: reasoning parameter still present: {chat_request['reasoning']}")
     
@@ -441,7 +445,7 @@ def convert_responses_to_chat_completions(request_data: dict) -> dict:
     validated_messages = validate_message_sequence(messages)
     chat_request["messages"] = validated_messages
     
-    logger.info(f"Converted to chat completions: {len(validated_messages)} messages, {len(chat_request.get('tools', []))} tools")
+    logger.debug("Converted to chat completions: %s messages, %s tools", len(validated_messages), len(chat_request.get('tools', [])))
     return chat_request
 
 
@@ -461,7 +465,7 @@ async def process_chat_completions_stream(response, chat_request=None):
     reasoning_item_id = f"rs_{uuid.uuid4().hex}"  # Consistent reasoning ID
     output_text_content = ""  # Track the full text content for logging
     reasoning_content = ""   # Accumulate reasoning_content from deltas
-    logger.info(f"Processing streaming response from chat.completions API response_id {response_id}; message_id {message_id}")
+    logger.debug("Processing streaming response from chat.completions API response_id %s; message_id %s", response_id, message_id)
     
     # Create and yield the initial response.created event
     response_obj = ResponseModel(
@@ -475,8 +479,8 @@ async def process_chat_completions_stream(response, chat_request=None):
         type="response.created",
         response=response_obj
     )
-    logger.info(f"Emitting {created_event}")
-    yield f"data: {json.dumps(created_event.dict())}\n\n"
+    logger.debug("Emitting %s", created_event)
+    yield b"data: " + orjson.dumps(created_event.dict()) + b"\n\n"
     
     # Also emit the in_progress event
     in_progress_event = ResponseInProgress(
@@ -484,8 +488,8 @@ async def process_chat_completions_stream(response, chat_request=None):
         response=response_obj
     )
     
-    logger.info(f"Emitting {in_progress_event}")
-    yield f"data: {json.dumps(in_progress_event.dict())}\n\n"
+    logger.debug("Emitting %s", in_progress_event)
+    yield b"data: " + orjson.dumps(in_progress_event.dict()) + b"\n\n"
     
     chunk_counter = 0
     try:
@@ -496,7 +500,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                 
             # Handle [DONE] message
             if chunk.strip() == "data: [DONE]" or chunk.strip() == "[DONE]":
-                logger.info(f"Received [DONE] message after {chunk_counter} chunks (status: {response_obj.status})")
+                logger.debug("Received [DONE] message after %s chunks (status: %s)", chunk_counter, response_obj.status)
                 
                 # If we haven't already completed the response, do it now
                 if response_obj.status != "completed":
@@ -517,8 +521,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                             "text": reasoning_content.strip()
                         }
                         
-                        logger.info(f"Emitting reasoning done event on [DONE]")
-                        yield f"data: {json.dumps(reasoning_done_event)}\n\n"
+                        logger.debug("Emitting reasoning done event on [DONE]")
+                        yield b"data: " + orjson.dumps(reasoning_done_event) + b"\n\n"
                         
                         # Add reasoning to output
                         output_items.append({
@@ -567,7 +571,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                         
                         # Store in conversation history
                         conversation_history[response_id] = messages
-                        logger.info(f"Saved conversation history for response_id {response_id} with {len(messages)} messages")
+                        logger.debug("Saved conversation history for response_id %s with %s messages", response_id, len(messages))
                         
                         # Trim conversation history if it grows too large
                         if len(conversation_history) > MAX_CONVERSATION_HISTORY:
@@ -576,10 +580,10 @@ async def process_chat_completions_stream(response, chat_request=None):
                             oldest_keys = sorted(conversation_history.keys())[:excess]
                             for key in oldest_keys:
                                 del conversation_history[key]
-                            logger.info(f"Trimmed {excess} oldest conversations from history")
+                            logger.debug("Trimmed %s oldest conversations from history", excess)
                     
-                    logger.info(f"Emitting completed event after [DONE]: {completed_event}")
-                    yield f"data: {json.dumps(completed_event.dict())}\n\n"
+                    logger.debug("Emitting completed event after [DONE]: %s", completed_event)
+                    yield b"data: " + orjson.dumps(completed_event.dict()) + b"\n\n"
                 continue
 
             # Skip prefix if present
@@ -588,7 +592,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                 
             try:
                 data = json.loads(chunk)
-                logger.info(f"data: {data}")
+                logger.debug("data: %s", data)
                 # Extract model name from the first chunk if available
                 if "model" in data and response_obj.model == "":
                     response_obj.model = data["model"]
@@ -616,8 +620,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                 "delta": reasoning_delta
                             }
                             
-                            logger.info(f"Emitting reasoning delta: {reasoning_delta[:50]}...")
-                            yield f"data: {json.dumps(reasoning_delta_event)}\n\n"
+                            logger.debug("Emitting reasoning delta: %.50s...", reasoning_delta)
+                            yield b"data: " + orjson.dumps(reasoning_delta_event) + b"\n\n"
 
                         # Handle OpenAI 'function_call' style deltas
                         if "function_call" in delta:
@@ -637,7 +641,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     output_index=0,
                                     tool_call={"id": tool_calls[index]["id"], "name": tool_calls[index]["function"]["name"], "arguments": ""}
                                 )
-                                yield f"data: {json.dumps(created_evt.dict())}\n\n"
+                                yield b"data: " + orjson.dumps(created_evt.dict()) + b"\n\n"
                             # Append argument fragment if present
                             if "arguments" in func and func.get("arguments") is not None:
                                 fragment = func.get("arguments")
@@ -649,7 +653,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     output_index=0,
                                     delta=fragment
                                 )
-                                yield f"data: {json.dumps(delta_evt.dict())}\n\n"
+                                yield b"data: " + orjson.dumps(delta_evt.dict()) + b"\n\n"
                             continue  # skip other tool call handling
 
                         # Handle legacy 'tool_calls' schema
@@ -675,13 +679,13 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         tool_call = tool_calls[index]
                                         tool_call["function"]["name"] = tool_delta["function"]["name"]
                                         # Log tool call creation
-                                        logger.info(f"Tool call created: {tool_call['function']['name']}")
+                                        logger.debug("Tool call created: %s", tool_call['function']['name'])
                                         
                                         # Check if this is an MCP tool or a user-defined tool
                                         is_mcp = mcp_manager.is_mcp_tool(tool_call["function"]["name"])
                                         tool_status = "in_progress" if is_mcp else "ready"
                                         
-                                        logger.info(f"[TOOL-CALL-CREATED] Tool '{tool_call['function']['name']}': is_mcp={is_mcp}, status={tool_status}")
+                                        logger.debug("[TOOL-CALL-CREATED] Tool '%s': is_mcp=%s, status=%s", tool_call['function']['name'], is_mcp, tool_status)
                                         
                                         # Add the tool call to the response output in Responses API format
                                         response_obj.output.append({
@@ -699,8 +703,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                             response=response_obj
                                         )
                                         
-                                        logger.info(f"Emitting {in_progress_event}")
-                                        yield f"data: {json.dumps(in_progress_event.dict())}\n\n"
+                                        logger.debug("Emitting %s", in_progress_event)
+                                        yield b"data: " + orjson.dumps(in_progress_event.dict()) + b"\n\n"
 
                                         tool_call_counter += 1
                                 
@@ -717,7 +721,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         delta=arg_fragment
                                     )
                                     
-                                    yield f"data: {json.dumps(args_event.dict())}\n\n"
+                                    yield b"data: " + orjson.dumps(args_event.dict()) + b"\n\n"
                         
                         # Handle content (text)
                         elif "content" in delta and delta["content"] is not None:
@@ -741,7 +745,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                 delta=content_delta
                             )
                             
-                            yield f"data: {json.dumps(text_event.dict())}\n\n"
+                            yield b"data: " + orjson.dumps(text_event.dict()) + b"\n\n"
                     
                                             # Capture reasoning_content that appears in full message objects (usually last chunk)
                         if "message" in choice:
@@ -760,15 +764,15 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     "delta": reasoning_delta
                                 }
                                 
-                                logger.info(f"Emitting reasoning delta from full message: {reasoning_delta[:50]}...")
-                                yield f"data: {json.dumps(reasoning_delta_event)}\n\n"
+                                logger.debug("Emitting reasoning delta from full message: %.50s...", reasoning_delta)
+                                yield b"data: " + orjson.dumps(reasoning_delta_event) + b"\n\n"
 
                     if "finish_reason" in choice and choice["finish_reason"] is not None:
-                        logger.info(f"Received finish_reason: {choice['finish_reason']}")
+                        logger.debug("Received finish_reason: %s", choice['finish_reason'])
                         
                         # If the finish reason indicates a function call, execute the tool via MCP
                         if choice["finish_reason"] == "function_call":
-                            logger.info("Processing tool call")
+                            logger.debug("Processing tool call")
                             for index, tool_call in tool_calls.items():
                                 tool_name = tool_call["function"]["name"]
                                 # Parse the arguments JSON
@@ -777,16 +781,16 @@ async def process_chat_completions_stream(response, chat_request=None):
                                 except Exception:
                                     args = {}
                                     
-                                logger.info(f"[TOOL-EXECUTE] Processing tool '{tool_name}' with args: {args}")
+                                logger.debug("[TOOL-EXECUTE] Processing tool '%s' with args: %s", tool_name, args)
                                 
                                 # Check if this is an MCP tool or a non-MCP tool
                                 if mcp_manager.is_mcp_tool(tool_name):
-                                    logger.info(f"[TOOL-EXECUTE] Executing MCP tool: {tool_name}")
+                                    logger.debug("[TOOL-EXECUTE] Executing MCP tool: %s", tool_name)
                                     # Execute MCP tool
                                     try:
                                         result = await mcp_manager.execute_mcp_tool(tool_name, args)
-                                        logger.info(f"[TOOL-EXECUTE] ✓ MCP tool '{tool_name}' executed successfully")
-                                        logger.debug(f"[TOOL-EXECUTE] MCP tool '{tool_name}' result: {result}")
+                                        logger.debug("[TOOL-EXECUTE] ✓ MCP tool '%s' executed successfully", tool_name)
+                                        logger.debug("[TOOL-EXECUTE] MCP tool '%s' result: %s", tool_name, result)
                                     except Exception as e:
                                         result = {"error": str(e)}
                                         logger.error(f"[TOOL-EXECUTE] ✗ MCP tool '{tool_name}' failed: {e}")
@@ -811,10 +815,10 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         output_index=0,
                                         delta=text
                                     )
-                                    yield f"data: {json.dumps(text_event.dict())}\n\n"
+                                    yield b"data: " + orjson.dumps(text_event.dict()) + b"\n\n"
                                 else:
                                     # For non-MCP tools, send the function call back to the client in Responses API format
-                                    logger.info(f"[TOOL-EXECUTE] Forwarding non-MCP tool call to client: {tool_name}")
+                                    logger.debug("[TOOL-EXECUTE] Forwarding non-MCP tool call to client: %s", tool_name)
                                     
                                     # Include the function call in the response
                                     response_obj.output.append({
@@ -865,7 +869,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     
                                     # Store in conversation history
                                     conversation_history[response_id] = messages
-                                    logger.info(f"Saved conversation history for response_id {response_id} with {len(messages)} messages")
+                                    logger.debug("Saved conversation history for response_id %s with %s messages", response_id, len(messages))
                                     
                                     # Trim conversation history if it grows too large
                                     if len(conversation_history) > MAX_CONVERSATION_HISTORY:
@@ -874,26 +878,26 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         oldest_keys = sorted(conversation_history.keys())[:excess]
                                         for key in oldest_keys:
                                             del conversation_history[key]
-                                        logger.info(f"Trimmed {excess} oldest conversations from history")
+                                        logger.debug("Trimmed %s oldest conversations from history", excess)
                                 
-                                logger.info(f"Emitting completed event after function_call: {completed_event}")
-                                yield f"data: {json.dumps(completed_event.dict())}\n\n"
+                                logger.debug("Emitting completed event after function_call: %s", completed_event)
+                                yield b"data: " + orjson.dumps(completed_event.dict()) + b"\n\n"
                                 return  # End streaming after function result
                         # If the finish reason is "tool_calls", emit the arguments.done events
                         if choice["finish_reason"] == "tool_calls":
-                            logger.info(f"[TOOL-CALLS-FINISH] Processing {len(tool_calls)} tool calls")
+                            logger.debug("[TOOL-CALLS-FINISH] Processing %s tool calls", len(tool_calls))
                             for index, tool_call in tool_calls.items():
                                 # Log the complete tool call arguments
-                                logger.info(f"[TOOL-CALLS-FINISH] Tool call completed: {tool_call['function']['name']} with arguments: {tool_call['function']['arguments']}")
+                                logger.debug("[TOOL-CALLS-FINISH] Tool call completed: %s with arguments: %s", tool_call['function']['name'], tool_call['function']['arguments'])
                                 
                                 # Check if this is an MCP tool or a user-defined tool
                                 is_mcp = mcp_manager.is_mcp_tool(tool_call["function"]["name"])
                                 
-                                logger.info(f"[TOOL-CALLS-FINISH] Tool '{tool_call['function']['name']}': is_mcp={is_mcp}")
+                                logger.debug("[TOOL-CALLS-FINISH] Tool '%s': is_mcp=%s", tool_call['function']['name'], is_mcp)
                                 
                                 # For MCP tools, execute them immediately
                                 if is_mcp:
-                                    logger.info(f"[TOOL-CALLS-FINISH] Executing MCP tool '{tool_call['function']['name']}'")
+                                    logger.debug("[TOOL-CALLS-FINISH] Executing MCP tool '%s'", tool_call['function']['name'])
                                     
                                     # Parse the arguments JSON
                                     try:
@@ -904,8 +908,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     # Execute MCP tool
                                     try:
                                         result = await mcp_manager.execute_mcp_tool(tool_call["function"]["name"], args)
-                                        logger.info(f"[TOOL-CALLS-FINISH] ✓ MCP tool '{tool_call['function']['name']}' executed successfully")
-                                        logger.debug(f"[TOOL-CALLS-FINISH] MCP tool result: {result}")
+                                        logger.debug("[TOOL-CALLS-FINISH] ✓ MCP tool '%s' executed successfully", tool_call['function']['name'])
+                                        logger.debug("[TOOL-CALLS-FINISH] MCP tool result: %s", result)
                                     except Exception as e:
                                         result = {"error": str(e)}
                                         logger.error(f"[TOOL-CALLS-FINISH] ✗ MCP tool '{tool_call['function']['name']}' failed: {e}")
@@ -917,8 +921,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         output_index=tool_call["output_index"],
                                         arguments=tool_call["function"]["arguments"]
                                     )
-                                    logger.info(f"Emitting {done_event}")
-                                    yield f"data: {json.dumps(done_event.dict())}\n\n"
+                                    logger.debug("Emitting %s", done_event)
+                                    yield b"data: " + orjson.dumps(done_event.dict()) + b"\n\n"
                                     
                                     # Add the tool execution result to the response
                                     response_obj.output.append({
@@ -941,13 +945,13 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         output_index=0,
                                         delta=text
                                     )
-                                    yield f"data: {json.dumps(text_event.dict())}\n\n"
+                                    yield b"data: " + orjson.dumps(text_event.dict()) + b"\n\n"
                                     
-                                    logger.info(f"[TOOL-CALLS-FINISH] Added function_call_output for MCP tool '{tool_call['function']['name']}'")
+                                    logger.debug("[TOOL-CALLS-FINISH] Added function_call_output for MCP tool '%s'", tool_call['function']['name'])
                                     
                                 else:
                                     # For non-MCP tools, emit arguments.done and leave them in ready state for client
-                                    logger.info(f"[TOOL-CALLS-FINISH] Keeping non-MCP tool '{tool_call['function']['name']}' in ready state for client")
+                                    logger.debug("[TOOL-CALLS-FINISH] Keeping non-MCP tool '%s' in ready state for client", tool_call['function']['name'])
                                     
                                     done_event = ToolCallArgumentsDone(
                                         type="response.function_call_arguments.done",
@@ -955,8 +959,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         output_index=tool_call["output_index"],
                                         arguments=tool_call["function"]["arguments"]
                                     )
-                                    logger.info(f"Emitting {done_event}")
-                                    yield f"data: {json.dumps(done_event.dict())}\n\n"
+                                    logger.debug("Emitting %s", done_event)
+                                    yield b"data: " + orjson.dumps(done_event.dict()) + b"\n\n"
                                     
                                     # Update response object for non-MCP tools
                                     # Find any existing entry for this tool call and update args
@@ -965,7 +969,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                         if output_item.get("id") == tool_call["id"] and output_item.get("type") == "function_call":
                                             output_item["arguments"] = tool_call["function"]["arguments"]
                                             found = True
-                                            logger.info(f"[TOOL-CALLS-FINISH] Updated existing function_call entry for '{tool_call['function']['name']}'")
+                                            logger.debug("[TOOL-CALLS-FINISH] Updated existing function_call entry for '%s'", tool_call['function']['name'])
                                             break
                                     
                                     # If not found, add it
@@ -978,7 +982,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                             "call_id": tool_call["id"],
                                             "status": "ready"
                                         })
-                                        logger.info(f"[TOOL-CALLS-FINISH] Added new function_call entry for '{tool_call['function']['name']}'")
+                                        logger.debug("[TOOL-CALLS-FINISH] Added new function_call entry for '%s'", tool_call['function']['name'])
                             
                             # After processing all tool calls, complete the response
                             response_obj.status = "completed"
@@ -1024,7 +1028,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                 
                                 # Store in conversation history
                                 conversation_history[response_id] = messages
-                                logger.info(f"Saved conversation history for response_id {response_id} with {len(messages)} messages")
+                                logger.debug("Saved conversation history for response_id %s with %s messages", response_id, len(messages))
                                 
                                 # Trim conversation history if it grows too large
                                 if len(conversation_history) > MAX_CONVERSATION_HISTORY:
@@ -1033,16 +1037,16 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     oldest_keys = sorted(conversation_history.keys())[:excess]
                                     for key in oldest_keys:
                                         del conversation_history[key]
-                                    logger.info(f"Trimmed {excess} oldest conversations from history")
+                                    logger.debug("Trimmed %s oldest conversations from history", excess)
                             
-                            logger.info(f"[TOOL-CALLS-FINISH] Completed processing all tool calls, final output has {len(response_obj.output)} items")
-                            logger.info(f"Emitting completed event after tool_calls: {completed_event}")
-                            yield f"data: {json.dumps(completed_event.dict())}\n\n"
+                            logger.debug("[TOOL-CALLS-FINISH] Completed processing all tool calls, final output has %s items", len(response_obj.output))
+                            logger.debug("Emitting completed event after tool_calls: %s", completed_event)
+                            yield b"data: " + orjson.dumps(completed_event.dict()) + b"\n\n"
                             return  # End streaming after tool processing
                         
                         # If the finish reason is "stop", emit the completed event
                         if choice["finish_reason"] == "stop":
-                            logger.info("Received stop finish reason")
+                            logger.debug("Received stop finish reason")
                             
                             # Build output array with reasoning and message
                             output_items = []
@@ -1061,8 +1065,8 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     "text": reasoning_content.strip()
                                 }
                                 
-                                logger.info(f"Emitting reasoning done event")
-                                yield f"data: {json.dumps(reasoning_done_event)}\n\n"
+                                logger.debug("Emitting reasoning done event")
+                                yield b"data: " + orjson.dumps(reasoning_done_event) + b"\n\n"
                                 
                                 # Add reasoning to output
                                 output_items.append({
@@ -1091,7 +1095,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                             })
                             
                             # Log complete output text
-                            logger.info(f"Response completed with text: {output_text_content[:100]}...\n\n")
+                            logger.debug("Response completed with text: %s...\n\n", output_text_content[:100])
                                 
                             response_obj.status = "completed"
                             response_obj.output = output_items
@@ -1113,7 +1117,7 @@ async def process_chat_completions_stream(response, chat_request=None):
                                 
                                 # Store in conversation history
                                 conversation_history[response_id] = messages
-                                logger.info(f"Saved conversation history for response_id {response_id} with {len(messages)} messages")
+                                logger.debug("Saved conversation history for response_id %s with %s messages", response_id, len(messages))
                                 
                                 # Trim conversation history if it grows too large
                                 if len(conversation_history) > MAX_CONVERSATION_HISTORY:
@@ -1122,10 +1126,10 @@ async def process_chat_completions_stream(response, chat_request=None):
                                     oldest_keys = sorted(conversation_history.keys())[:excess]
                                     for key in oldest_keys:
                                         del conversation_history[key]
-                                    logger.info(f"Trimmed {excess} oldest conversations from history")
+                                    logger.debug("Trimmed %s oldest conversations from history", excess)
                             
-                            logger.info(f"Emitting completed event after stop: {completed_event}")
-                            yield f"data: {json.dumps(completed_event.dict())}\n\n"
+                            logger.debug("Emitting completed event after stop: %s", completed_event)
+                            yield b"data: " + orjson.dumps(completed_event.dict()) + b"\n\n"
                 
             except json.JSONDecodeError:
                 logger.error(f"Failed to parse JSON from chunk: {chunk}")
@@ -1143,4 +1147,4 @@ async def process_chat_completions_stream(response, chat_request=None):
                 response=response_obj
             )
             
-            yield f"data: {json.dumps(completed_event.dict())}\n\n" 
\ No newline at end of file
+            yield b"data: " + orjson.dumps(completed_event.dict()) + b"\n\n" 
\ No newline at end of file
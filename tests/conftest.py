@@ -237,4 +237,32 @@ def mock_httpx_client(monkeypatch):
             pass
     
     monkeypatch.setattr("httpx.AsyncClient", MockAsyncClient)
-    return MockAsyncClient() 
\ No newline at end of file
+    return MockAsyncClient() 
+
+class FakeUpstream:
+    """Minimal stand-in for a streamed httpx.Response that counts the chunks read"""
+
+    def __init__(self, chunks, gate=None, delay=0):
+        self.chunks = chunks
+        self.gate = gate
+        self.delay = delay
+        self.read = 0
+        self.closed = False
+
+    async def aiter_raw(self):
+        for chunk in self.chunks:
+            if self.gate is not None:
+                await self.gate.wait()
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            self.read += 1
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_upstream():
+    """The FakeUpstream class, for tests that relay streamed upstream responses."""
+    return FakeUpstream
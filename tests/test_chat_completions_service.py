@@ -0,0 +1,80 @@
+"""
+Tests for request routing in the /v1/chat/completions service
+"""
+import orjson
+import pytest
+from open_responses_server import chat_completions_service
+from open_responses_server.common import mcp_manager as mcp_manager_module
+from open_responses_server.common.mcp_manager import mcp_manager
+
+
+class FakeRequest:
+    """Minimal stand-in for a Starlette Request with a fixed body"""
+
+    def __init__(self, body):
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+@pytest.fixture
+def forwarded(monkeypatch):
+    """Records the body sent upstream and whether it went out as a stream"""
+    calls = []
+
+    async def get_client():
+        return object()
+
+    async def proxy_stream(client, body, coalesce_key=None):
+        calls.append(("stream", body))
+
+    async def cached_chat_completion(client, body, cache_key=None):
+        calls.append(("non-stream", body))
+
+    monkeypatch.setattr(chat_completions_service.LLMClient, "get_client", get_client)
+    monkeypatch.setattr(chat_completions_service, "_proxy_stream", proxy_stream)
+    monkeypatch.setattr(chat_completions_service, "_cached_chat_completion", cached_chat_completion)
+    return calls
+
+
+class TestRawForwarding:
+    """Tests for which requests are forwarded from the client's raw body"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body, mode", [
+        (b'{"model": "m", "messages": [], "stream": true}', "stream"),
+        (b'{"model": "m", "messages": []}', "non-stream"),
+        (b'{"model": "m", "messages": [], "stream": false, "temperature": 0}', "non-stream"),
+    ])
+    async def test_unmodified_requests_forward_raw_body(self, forwarded, body, mode):
+        """Requests that need no rewriting are sent upstream byte for byte"""
+        await chat_completions_service.handle_chat_completions(FakeRequest(body))
+        assert forwarded == [(mode, body)]
+        assert forwarded[0][1] is body
+
+    @pytest.mark.asyncio
+    async def test_non_boolean_stream_is_reserialized(self, forwarded):
+        """A truthy non-boolean stream flag is streamed with a normalized body"""
+        body = b'{"model": "m", "messages": [], "stream": 1}'
+        await chat_completions_service.handle_chat_completions(FakeRequest(body))
+        assert forwarded[0][0] == "stream"
+        assert orjson.loads(forwarded[0][1])["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_null_reasoning_is_removed(self, forwarded):
+        """A reasoning parameter with only null values is stripped before forwarding"""
+        body = b'{"model": "m", "messages": [], "stream": true, "reasoning": {"effort": null}}'
+        await chat_completions_service.handle_chat_completions(FakeRequest(body))
+        assert forwarded[0][0] == "stream"
+        assert "reasoning" not in orjson.loads(forwarded[0][1])
+
+    @pytest.mark.asyncio
+    async def test_mcp_injection_rewrites_body(self, forwarded, monkeypatch):
+        """While MCP tools are injected, the forwarded body carries them"""
+        monkeypatch.setattr(mcp_manager_module, "ENABLE_MCP_TOOLS", True)
+        monkeypatch.setattr(mcp_manager, "_tools_chatfmt", ({"type": "function", "function": {"name": "search"}},))
+        body = b'{"model": "m", "messages": [], "stream": true}'
+        await chat_completions_service.handle_chat_completions(FakeRequest(body))
+        assert forwarded[0][0] == "stream"
+        assert [tool["function"]["name"] for tool in orjson.loads(forwarded[0][1])["tools"]] == ["search"]
@@ -0,0 +1,63 @@
+"""
+Tests for MCP tool injection into chat.completions requests
+"""
+import pytest
+from open_responses_server.common import mcp_manager as mcp_manager_module
+from open_responses_server.common.mcp_manager import MCPManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """An MCPManager with two cached MCP tools and MCP injection enabled"""
+    monkeypatch.setattr(mcp_manager_module, "ENABLE_MCP_TOOLS", True)
+    manager = MCPManager()
+    manager._tools_chatfmt = tuple(
+        {"type": "function", "function": {"name": name, "parameters": {}}}
+        for name in ("search", "fetch")
+    )
+    return manager
+
+
+class TestInjectChatTools:
+    """Tests for MCPManager.inject_chat_tools"""
+
+    def test_request_tools_keep_priority(self, manager):
+        """A request tool with an MCP tool's name wins and the MCP tool is skipped"""
+        client_tool = {"type": "function", "function": {"name": "search", "description": "client"}}
+        request = {"tools": [client_tool]}
+
+        assert manager.inject_chat_tools(request) == 1
+        assert request["tools"][0] is client_tool
+        assert [tool["function"]["name"] for tool in request["tools"]] == ["search", "fetch"]
+
+    def test_null_tools(self, manager):
+        """A request with "tools": null receives every MCP tool"""
+        request = {"tools": None}
+
+        assert manager.inject_chat_tools(request) == 2
+        assert [tool["function"]["name"] for tool in request["tools"]] == ["search", "fetch"]
+
+    def test_no_tool_added_leaves_request_untouched(self, manager):
+        """When every MCP tool name is taken, the request is not modified"""
+        tools = [{"type": "function", "function": {"name": name}} for name in ("search", "fetch")]
+        request = {"tools": tools}
+
+        assert manager.inject_chat_tools(request) == 0
+        assert request == {"tools": tools}
+        assert request["tools"] is tools
+
+    def test_legacy_functions_left_alone(self, manager):
+        """Legacy functions and function_call are passed through unchanged"""
+        request = {"functions": [{"name": "f"}], "function_call": {"name": "f"}}
+
+        assert manager.inject_chat_tools(request) == 2
+        assert request["functions"] == [{"name": "f"}]
+        assert request["function_call"] == {"name": "f"}
+
+    def test_disabled(self, manager, monkeypatch):
+        """Nothing is injected while MCP tools are disabled"""
+        monkeypatch.setattr(mcp_manager_module, "ENABLE_MCP_TOOLS", False)
+        request = {"messages": []}
+
+        assert manager.inject_chat_tools(request) == 0
+        assert request == {"messages": []}
@@ -0,0 +1,43 @@
+"""
+Tests for RawProxyResponse, the raw ASGI relay used for streaming chat completions
+"""
+import asyncio
+import pytest
+from open_responses_server.chat_completions_service import RawProxyResponse
+
+
+class TestRawProxyResponse:
+    """Tests for RawProxyResponse"""
+
+    @pytest.mark.asyncio
+    async def test_relays_whole_stream(self, fake_upstream):
+        """Every upstream chunk is sent, followed by the final empty body message"""
+        upstream = fake_upstream([b"data: %d\n\n" % i for i in range(5)])
+        sent = []
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+
+        await RawProxyResponse(upstream)({}, receive, send)
+        assert sent[0]["type"] == "http.response.start"
+        assert [m["body"] for m in sent[1:]] == [b"data: %d\n\n" % i for i in range(5)] + [b""]
+        assert upstream.closed
+
+    @pytest.mark.asyncio
+    async def test_client_disconnect_closes_upstream(self, fake_upstream):
+        """A client disconnect stops forwarding and closes the upstream stream"""
+        upstream = fake_upstream([b"data: %d\n\n" % i for i in range(200)], delay=0.001)
+
+        async def receive():
+            await asyncio.sleep(0.01)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            pass
+
+        await RawProxyResponse(upstream)({}, receive, send)
+        assert upstream.read < 200
+        assert upstream.closed
@@ -0,0 +1,77 @@
+"""
+Tests for the async result cache used by /v1/chat/completions
+"""
+import asyncio
+import pytest
+from open_responses_server.common.response_cache import AsyncResultCache, request_cache_key
+
+
+class TestResponseCache:
+    """Tests for AsyncResultCache and request_cache_key"""
+
+    def test_cache_key_ignores_key_order(self):
+        """Payloads that differ only in key order share a cache key"""
+        a = {"model": "m", "temperature": 0, "messages": [{"role": "user", "content": "hi"}]}
+        b = {"messages": [{"content": "hi", "role": "user"}], "temperature": 0, "model": "m"}
+        assert request_cache_key(a) == request_cache_key(b)
+        assert request_cache_key(a) != request_cache_key({**a, "model": "other"})
+
+    @pytest.mark.asyncio
+    async def test_returns_cached_value(self):
+        """A second lookup is served without recomputing"""
+        cache = AsyncResultCache(maxsize=4, ttl=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"id": "r1"}
+
+        assert await cache.get_or_compute(b"k", compute) == {"id": "r1"}
+        assert await cache.get_or_compute(b"k", compute) == {"id": "r1"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_and_expired_values_are_recomputed(self):
+        """Values rejected by cacheable, or past their TTL, are not served again"""
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"error": "boom"}
+
+        cache = AsyncResultCache(maxsize=4, ttl=60)
+        await cache.get_or_compute(b"k", compute, cacheable=lambda value: "error" not in value)
+        await cache.get_or_compute(b"k", compute, cacheable=lambda value: "error" not in value)
+        assert len(calls) == 2
+
+        expired = AsyncResultCache(maxsize=4, ttl=0)
+        await expired.get_or_compute(b"k", compute)
+        await expired.get_or_compute(b"k", compute)
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """The cache holds at most maxsize entries"""
+        cache = AsyncResultCache(maxsize=2, ttl=60)
+
+        async def value(v):
+            return v
+
+        for key in (b"a", b"b", b"c"):
+            await cache.get_or_compute(key, lambda key=key: value(key))
+        assert await cache.get_or_compute(b"a", lambda: value(b"recomputed")) == b"recomputed"
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_lookups(self):
+        """Concurrent lookups of the same key share one computation"""
+        cache = AsyncResultCache(maxsize=4, ttl=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "shared"}
+
+        results = await asyncio.gather(*(cache.get_or_compute(b"k", compute) for _ in range(5)))
+        assert results == [{"id": "shared"}] * 5
+        assert len(calls) == 1
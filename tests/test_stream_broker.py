@@ -0,0 +1,94 @@
+"""
+Tests for the shared upstream stream broker used by /v1/chat/completions
+"""
+import asyncio
+import pytest
+from open_responses_server.common.stream_broker import InflightStreamBroker
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestStreamBroker:
+    """Tests for InflightStreamBroker"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_subscribers_share_one_upstream(self, fake_upstream):
+        """Subscribers that join while a stream is in flight receive every chunk"""
+        broker = InflightStreamBroker()
+        gate = asyncio.Event()
+        opened = []
+
+        async def open_upstream():
+            upstream = fake_upstream([b"data: 1\n\n", b"data: 2\n\n", b"data: [DONE]\n\n"], gate)
+            opened.append(upstream)
+            return upstream
+
+        first = asyncio.create_task(collect(broker.subscribe(b"k", open_upstream)))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(collect(broker.subscribe(b"k", open_upstream)))
+        gate.set()
+
+        assert await first == await second == [b"data: 1\n\n", b"data: 2\n\n", b"data: [DONE]\n\n"]
+        assert len(opened) == 1
+        assert opened[0].closed
+
+    @pytest.mark.asyncio
+    async def test_finished_stream_is_not_reused(self, fake_upstream):
+        """A request arriving after the stream ended opens a new upstream stream"""
+        broker = InflightStreamBroker()
+        opened = []
+
+        async def open_upstream():
+            opened.append(1)
+            return fake_upstream([b"data: [DONE]\n\n"])
+
+        await collect(broker.subscribe(b"k", open_upstream))
+        await collect(broker.subscribe(b"k", open_upstream))
+        assert len(opened) == 2
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_is_sent_to_subscribers(self):
+        """Failures to open the upstream stream end each subscriber with an error frame"""
+        broker = InflightStreamBroker()
+
+        async def open_upstream():
+            raise RuntimeError("backend down")
+
+        chunks = await collect(broker.subscribe(b"k", open_upstream))
+        assert chunks == [b'data: {"error":"backend down"}\n\n']
+
+    @pytest.mark.asyncio
+    async def test_rejoin_after_cancel_opens_new_upstream(self, fake_upstream):
+        """A request arriving while a cancelled stream is closing gets a complete new stream"""
+        broker = InflightStreamBroker()
+        gate = asyncio.Event()
+        release_close = asyncio.Event()
+        opened = []
+
+        class SlowClosingUpstream(fake_upstream):
+            async def aclose(self):
+                await release_close.wait()
+                self.closed = True
+
+        async def open_upstream():
+            if not opened:
+                upstream = SlowClosingUpstream([b"data: 1\n\n", b"data: [DONE]\n\n"], gate)
+            else:
+                upstream = fake_upstream([b"data: 1\n\n", b"data: [DONE]\n\n"])
+            opened.append(upstream)
+            return upstream
+
+        # The only subscriber leaves while the upstream is still being closed
+        first = asyncio.create_task(collect(broker.subscribe(b"k", open_upstream)))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        retry = asyncio.create_task(collect(broker.subscribe(b"k", open_upstream)))
+        release_close.set()
+        gate.set()
+        assert await retry == [b"data: 1\n\n", b"data: [DONE]\n\n"]
+        assert len(opened) == 2
@@ -0,0 +1,44 @@
+"""
+Tests for the "stream" flag detection used by the generic proxy endpoint
+"""
+import pytest
+from open_responses_server.api_controller import _peek_stream_flag
+
+
+class FakeRequest:
+    """Minimal stand-in for a Starlette Request whose body arrives in chunks"""
+
+    def __init__(self, body, chunk_size):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def stream(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+async def peek(body, chunk_size):
+    """Returns the detected flag and the complete forwarded body"""
+    is_stream, content = await _peek_stream_flag(FakeRequest(body, chunk_size))
+    if not isinstance(content, bytes):
+        content = b"".join([chunk async for chunk in content])
+    return is_stream, content
+
+
+class TestPeekStreamFlag:
+    """Tests for _peek_stream_flag"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body, expected", [
+        (b'{"model": "m", "stream": true}', True),
+        (b'{"stream":false,"model":"m"}', False),
+        (b'{"metadata": {"stream": false}, "input": "x", "stream": true}', True),
+        (b'{"metadata": {"stream": true}, "stream": false}', False),
+        (b'{"metadata": {"stream": true}}', False),
+        (b'{"input": [{"text": "\\"stream\\": true"}], "stream": true}', True),
+        (b'{"model": "stream", "n": 1}', False),
+    ])
+    async def test_top_level_flag_at_any_chunking(self, body, expected):
+        """Only the top-level member counts, and the body is forwarded unchanged"""
+        for chunk_size in range(1, len(body) + 1):
+            assert await peek(body, chunk_size) == (expected, body)